@@ -1,5 +1,6 @@
 import sys, os
-from typing import Any, List, Union
+from functools import lru_cache
+from typing import Any, List, Optional, Union
 
 from PyQt5 import QtCore, QtGui, QtWidgets, uic
 from tablerqicon import TablerQIcon
@@ -13,6 +14,19 @@ from popup_widget import PopupWidget
 # Define the path to the UI file
 ADVANCED_FILTER_SEARCH_UI_FILE = os.path.join(os.path.dirname(__file__), 'ui/advanced_filter_search_widget.ui')
 
+@lru_cache(maxsize=None)
+def get_tabler_qicon(opacity: Optional[float] = None) -> TablerQIcon:
+    """Get a TablerQIcon shared by all the widgets using the same opacity.
+
+    Args:
+        opacity (Optional[float]): The opacity of the icons. Defaults to None, which uses the TablerQIcon default.
+
+    Returns:
+        TablerQIcon: The shared TablerQIcon instance.
+    """
+    # Create the TablerQIcon once per opacity, the result is cached by lru_cache
+    return TablerQIcon() if opacity is None else TablerQIcon(opacity=opacity)
+
 def intersection(item_list_1: List[Any], item_list_2: List[Any]) -> List[Any]:
     """Calculates the intersection of two lists.
 
@@ -23,8 +37,12 @@ def intersection(item_list_1: List[Any], item_list_2: List[Any]) -> List[Any]:
     Returns:
         List[Any] : The items that exist in both lists.
     """
-    # Return the items that exist in both lists
-    return [item for item in item_list_1 if item in item_list_2]
+    # Create a set of the ids of the second list for constant time membership checks
+    # NOTE: Tree widget items are not hashable, so they are keyed by identity, which is also how the items compare
+    item_ids_2 = {id(item) for item in item_list_2}
+
+    # Return the items that exist in both lists, keeping the order of the first list
+    return [item for item in item_list_1 if id(item) in item_ids_2]
 
 class HighlightItemDelegate(QtWidgets.QStyledItemDelegate):
     """Custom item delegate class that highlights the rows specified by the `target_model_indexes` list.
@@ -44,6 +62,8 @@ class HighlightItemDelegate(QtWidgets.QStyledItemDelegate):
 
         # Set the color attribute
         self.color = color
+        # Create the brush used to fill highlighted cells once, rather than on every paint
+        self.brush = QtGui.QBrush(self.color, QtCore.Qt.BrushStyle.SolidPattern)
     
     def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, model_index: QtCore.QModelIndex):
         """Paint the delegate.
@@ -59,12 +79,8 @@ class HighlightItemDelegate(QtWidgets.QStyledItemDelegate):
             super().paint(painter, option, model_index)
             return
 
-        # If the current model index is in the target list, set the background color and style
-        option.backgroundBrush.setColor(self.color)
-        option.backgroundBrush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
-
-        # Fill the rect with the background brush
-        painter.fillRect(option.rect, option.backgroundBrush)
+        # If the current model index is in the target list, fill the rect with the highlight brush
+        painter.fillRect(option.rect, self.brush)
 
         # Paint the item normally using the parent implementation
         super().paint(painter, option, model_index)
@@ -102,8 +118,13 @@ class FilterTreeWidget(QtWidgets.QTreeWidget):
         self.filter_criteria_list = list()
 
         # Initialize the QIcon objects for use in the UI with specified color and opacity
-        self.tabler_action_qicon = TablerQIcon(opacity=0.6)
-        self.tabler_button_qicon = TablerQIcon()
+        self.tabler_action_qicon = get_tabler_qicon(opacity=0.6)
+        self.tabler_button_qicon = get_tabler_qicon()
+
+        # Look up the icons used on every filter item once, rather than for each added filter
+        self.negate_icon = self.tabler_action_qicon.a_b_off
+        self.match_case_icon = self.tabler_action_qicon.letter_case
+        self.remove_icon = self.tabler_button_qicon.trash
 
     def _setup_ui(self):
         """Set up the filter tree widget, including header columns and adding a clear button to the header.
@@ -178,7 +199,7 @@ class FilterTreeWidget(QtWidgets.QTreeWidget):
             check_state (bool, optional): The initial check state of the button. Defaults to False.
         """
         # Create a negate button
-        negate_button = QtWidgets.QPushButton(self.tabler_action_qicon.a_b_off, '', self)
+        negate_button = QtWidgets.QPushButton(self.negate_icon, '', self)
 
         # Set the button as checkable and its initial check state
         negate_button.setCheckable(True)
@@ -197,7 +218,7 @@ class FilterTreeWidget(QtWidgets.QTreeWidget):
             check_state (bool, optional): The initial check state of the button. Defaults to False.
         """
         # Create a match case button
-        match_case_button = QtWidgets.QPushButton(self.tabler_action_qicon.letter_case, '', self)
+        match_case_button = QtWidgets.QPushButton(self.match_case_icon, '', self)
 
         # Set the button as checkable and its initial check state
         match_case_button.setCheckable(True)
@@ -215,7 +236,7 @@ class FilterTreeWidget(QtWidgets.QTreeWidget):
             tree_item (QtWidgets.QTreeWidgetItem): The tree item to add the button to.
         """
         # Create a push button for removing the filter item
-        remove_button = QtWidgets.QPushButton(self.tabler_button_qicon.trash, '', self)
+        remove_button = QtWidgets.QPushButton(self.remove_icon, '', self)
         
         # Set the tool tip for the remove button
         remove_button.setToolTip('Remove this filter item')
@@ -255,6 +276,7 @@ class FilterTreeWidget(QtWidgets.QTreeWidget):
         # Emit signal indicating the number of filter criteria has changed
         self.filter_count_changed.emit(len(self.filter_criteria_list))
 
+    @QtCore.pyqtSlot()
     def clear_filters(self):
         """Slot for the "Clear Filters" button.
         """
@@ -304,6 +326,9 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
         'reg_exp': QtCore.Qt.MatchFlag.MatchRegularExpression,
     }
 
+    # Delay in milliseconds after the last keyword change before the search is highlighted
+    HIGHLIGHT_DEBOUNCE_MS = 150
+
     # Initialization and Setup
     # ------------------------
     def __init__(self, tree_widget: GroupableTreeWidget, parent=None):
@@ -332,13 +357,33 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
         """Set up the initial values for the widget.
         """
         # Initialize the QIcon objects for use in the UI with specified color and opacity
-        self.tabler_action_qicon = TablerQIcon(opacity=0.6)
-        self.tabler_action_checked_qicon = TablerQIcon()
-        self.tabler_button_qicon = TablerQIcon()
+        self.tabler_action_qicon = get_tabler_qicon(opacity=0.6)
+        self.tabler_action_checked_qicon = get_tabler_qicon()
+        self.tabler_button_qicon = get_tabler_qicon()
+
+        # Look up the match action icons for both check states once, rather than on every toggle
+        self.match_case_icons = {
+            False: self.tabler_action_qicon.letter_case,
+            True: self.tabler_action_checked_qicon.letter_case,
+        }
+        self.negate_icons = {
+            False: self.tabler_action_qicon.a_b_off,
+            True: self.tabler_action_checked_qicon.a_b_off,
+        }
 
         # Initialize the HighlightItemDelegate object to highlight items in the tree widget.
         self.highlight_item_delegate = HighlightItemDelegate()
 
+        # Create a timer to debounce highlighting while the keyword is being typed
+        self._highlight_timer = QtCore.QTimer(self)
+        self._highlight_timer.setSingleShot(True)
+        self._highlight_timer.setInterval(self.HIGHLIGHT_DEBOUNCE_MS)
+
+        # Create a zero-interval timer to coalesce the grouping signals emitted by a single regroup
+        self._regroup_timer = QtCore.QTimer(self)
+        self._regroup_timer.setSingleShot(True)
+        self._regroup_timer.setInterval(0)
+
     def _setup_ui(self):
         """Set up the UI for the widget, including creating widgets and layouts.
         """
@@ -347,13 +392,11 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
         self.condition_combo_box.addItems(self.CONDITION_TO_MATCH_FLAG_DICT)
 
         # Create a filter tree widget instance for managing filters
-        self.filter_tree_widget = FilterTreeWidget(self)
+        # NOTE: The widget is created without a parent, it is reparented into the popup widget once the popup is created
+        self.filter_tree_widget = FilterTreeWidget()
 
-        # Create a popup widget that contains the filter management widget
-        self.filter_tree_popup = PopupWidget(
-            widget=self.filter_tree_widget,
-            parent=self,
-        )
+        # The popup widget that contains the filter management widget is created the first time it is shown
+        self.filter_tree_popup = None
         
         # Add action to keyword line edit
         self._add_action_on_keyword_line_edit()
@@ -370,17 +413,20 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
         self.keyword_line_edit.returnPressed.connect(self.add_filter)
 
         # Connect match options to slots
-        self.keyword_line_edit.textChanged.connect(self._highlight_search)
+        # NOTE: Keyword changes restart the debounce timer, so highlighting runs once typing pauses
+        self.keyword_line_edit.textChanged.connect(self._highlight_timer.start)
+        self._highlight_timer.timeout.connect(self._highlight_search)
         self.column_combo_box.activated.connect(self._highlight_search)
         self.condition_combo_box.activated.connect(self._highlight_search)
         self.match_case_action.triggered.connect(self._highlight_search)
         self.negate_action.triggered.connect(self._highlight_search)
 
         # Connect grouping signals to slots
-        self.tree_widget.grouped_by_column.connect(self._highlight_search)
-        self.tree_widget.grouped_by_column.connect(self._apply_filters)
-        self.tree_widget.ungrouped_all.connect(self._highlight_search)
-        self.tree_widget.ungrouped_all.connect(self._apply_filters)
+        # NOTE: Regrouping emits both ungrouped_all and grouped_by_column, so both restart the timer and the search is refreshed once
+        self.tree_widget.grouped_by_column.connect(self._regroup_timer.start)
+        self.tree_widget.ungrouped_all.connect(self._regroup_timer.start)
+        self._regroup_timer.timeout.connect(self._highlight_search)
+        self._regroup_timer.timeout.connect(self._apply_filters)
 
         # Connect filter count changed signals to slots
         self.filter_tree_widget.filter_count_changed.connect(self._update_show_filter_button)
@@ -397,8 +443,7 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
         self.tree_widget.header().sectionClicked.connect(self._highlight_search)
 
         # Connect a signal to control the visibility of the filter_tree_popup based on the toggled state of the show_filter_button
-        self.show_filter_button.toggled.connect(self.filter_tree_popup.setVisible)
-        self.filter_tree_popup.close_button.clicked.connect(self.show_filter_button.setChecked)
+        self.show_filter_button.toggled.connect(self._set_filter_tree_popup_visible)
 
         # Create a shortcut for Ctrl+F
         shortcut = QtWidgets.QShortcut(QtGui.QKeySequence("Ctrl+F"), self)
@@ -407,6 +452,32 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
 
     # Private Methods
     # ---------------
+    @QtCore.pyqtSlot(bool)
+    def _set_filter_tree_popup_visible(self, visible: bool):
+        """Show or hide the popup widget containing the filter tree widget, creating it on first show.
+
+        Args:
+            visible (bool): True to show the popup widget, False to hide it.
+        """
+        # Create the popup widget the first time it is shown
+        if self.filter_tree_popup is None:
+            # Nothing to hide if the popup widget has not been created yet
+            if not visible:
+                return
+
+            # Create a popup widget that contains the filter management widget
+            # NOTE: The popup follows the window through an event filter, which works even though the window is already shown
+            self.filter_tree_popup = PopupWidget(
+                widget=self.filter_tree_widget,
+                parent=self,
+            )
+            # Uncheck the show filter button when the popup widget is closed
+            self.filter_tree_popup.close_button.clicked.connect(self.show_filter_button.setChecked)
+
+        # Set the visibility of the popup widget
+        self.filter_tree_popup.setVisible(visible)
+
+    @QtCore.pyqtSlot()
     def _update_column_combo_box(self):
         """Update the column combo box with the column names from the tree widget's header.
 
@@ -425,6 +496,7 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
         # Add the column names to the column combo box
         self.column_combo_box.addItems(self.column_names)
 
+    @QtCore.pyqtSlot()
     def _set_filter_as_selection(self):
         """Set the filter based on the selected item in the tree widget.
 
@@ -453,14 +525,14 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
         """Add two actions to the keyword line edit widget: match case and negate match.
         """
         # Add the match case action to the keyword line edit widget
-        self.match_case_action = self.keyword_line_edit.addAction(self.tabler_action_qicon.letter_case, QtWidgets.QLineEdit.ActionPosition.TrailingPosition)
+        self.match_case_action = self.keyword_line_edit.addAction(self.match_case_icons[False], QtWidgets.QLineEdit.ActionPosition.TrailingPosition)
         # Set the tool tip to "Match Case"
         self.match_case_action.setToolTip('Match Case')
         # Set the action to be checkable
         self.match_case_action.setCheckable(True)
 
         # Add the negate match action to the keyword line edit widget
-        self.negate_action = self.keyword_line_edit.addAction(self.tabler_action_qicon.a_b_off, QtWidgets.QLineEdit.ActionPosition.TrailingPosition)
+        self.negate_action = self.keyword_line_edit.addAction(self.negate_icons[False], QtWidgets.QLineEdit.ActionPosition.TrailingPosition)
         # Set the tool tip to "Negate Match"
         self.negate_action.setToolTip('Negate Match')
         # Set the action to be checkable
@@ -493,13 +565,18 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
         # Get all items in the tree widget
         all_items = self.tree_widget.get_all_items()
 
-        # Loop through all items
-        for tree_item in all_items:
-            # Get the row index of the item
-            item_index = self.tree_widget.indexFromItem(tree_item).row()
+        # Get the distinct row indexes of all items, rows are relative to the parent so they repeat when grouped
+        item_indexes = {self.tree_widget.indexFromItem(tree_item).row() for tree_item in all_items}
+
+        # Loop through the row indexes
+        for item_index in item_indexes:
+            # Skip rows without a delegate, since setting it again would still schedule a relayout of the view
+            if self.tree_widget.itemDelegateForRow(item_index) is None:
+                continue
             # Set the delegate for the row to None
             self.tree_widget.setItemDelegateForRow(item_index, None)
 
+    @QtCore.pyqtSlot()
     def _apply_filters(self):
         """Apply the filters specified by the user to the tree widget.
         """
@@ -524,6 +601,7 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
         # Show the items that match all filter criteria and their parent and children
         self.show_matching_items(intersect_match_items)
         
+    @QtCore.pyqtSlot(int)
     def _update_show_filter_button(self, filter_count: int = 0):
         """Updates the text of the show filter button to reflect the number of active filters.
 
@@ -535,6 +613,7 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
         # Set the text of the show filter button to the filter count
         self.show_filter_button.setText(filter_count)
 
+    @QtCore.pyqtSlot()
     def _highlight_search(self):
         """Highlight the items in the tree widget that match the search criteria.
         """
@@ -604,33 +683,36 @@ class AdvancedFilterSearch(QtWidgets.QWidget):
         match_items = self.tree_widget.findItems(keyword, flags, column_index)
         match_items_at_child_level = intersection(all_items_at_child_level, match_items)
 
-        # Negate the match results if is_negate is set to True
+        # Negate the match results if is_negate is set to True, using a set of ids for constant time membership checks
+        # NOTE: Tree widget items are not hashable, so they are keyed by identity
         if is_negate:
-            match_items_at_child_level = [item for item in all_items_at_child_level if item not in match_items_at_child_level]
+            match_item_ids = {id(item) for item in match_items_at_child_level}
+            match_items_at_child_level = [item for item in all_items_at_child_level if id(item) not in match_item_ids]
         
         # Return the list of items that match the criteria.
         return match_items_at_child_level
 
+    @QtCore.pyqtSlot(bool)
     def set_case_sensitive_state(self, state: bool):
         """Update the is_case_sensitive member variable when the match case action state changes.
 
             Args:
                 state (bool): The state of match case action.
         """
-        # Update the tabler_qicon based on the state of the match case action
-        tabler_qicon = self.tabler_action_checked_qicon if state else self.tabler_action_qicon
-        self.match_case_action.setIcon(tabler_qicon.letter_case)
+        # Update the icon based on the state of the match case action
+        self.match_case_action.setIcon(self.match_case_icons[state])
 
+    @QtCore.pyqtSlot(bool)
     def set_negate_state(self, state: bool):
         """Update the is_negate member variable when the negate action state changes.
 
             Args:
                 state (bool): The state of negate action.
         """
-        # Update the tabler_qicon based on the state of the negate action
-        tabler_qicon = self.tabler_action_checked_qicon if state else self.tabler_action_qicon
-        self.negate_action.setIcon(tabler_qicon.a_b_off)
+        # Update the icon based on the state of the negate action
+        self.negate_action.setIcon(self.negate_icons[state])
 
+    @QtCore.pyqtSlot()
     def add_filter(self):
         """Add a filter to the tree widget. Called when the "Add Filter" button is clicked 
         or when the Enter key is pressed in the keyword_line_edit widget.
@@ -1,6 +1,8 @@
 import sys
-import time
 import datetime
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 from PyQt5.QtWidgets import QWidget
 import dateutil.parser as date_parser
 
@@ -11,6 +13,13 @@ from PyQt5 import QtWidgets, QtCore, QtGui
 
 from theme.theme import set_theme
 
+# Item data roles, resolved once since they are looked up for every item in sorting and painting
+USER_ROLE = QtCore.Qt.ItemDataRole.UserRole
+DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
+
+# Date format that can be parsed with datetime.date.fromisoformat
+ISO_DATE_FORMAT = '%Y-%m-%d'
+
 # Define example data
 COLUMN_NAME_LIST = [
     'shot_id',
@@ -157,15 +166,25 @@ def create_pastel_color(color: QtGui.QColor, saturation: float = 0.4, value: flo
     pastel_color = QtGui.QColor.fromHsvF(h, s, v, a)
     return pastel_color
 
+@lru_cache(maxsize=1024)
 def parse_date(date_string: str) -> Optional[datetime.datetime]:
     """Parse the given date string into a datetime.datetime object.
 
+    The results are memoized, since the same cell values are parsed again on every repaint.
+
     Args:
         date_string: The date string to parse.
 
     Returns:
         The parsed datetime object, or None if parsing fails.
     """
+    # Try the much faster datetime.datetime.fromisoformat first, since ISO 8601 is the most common format
+    try:
+        return datetime.datetime.fromisoformat(date_string)
+    except ValueError:
+        pass
+
+    # Otherwise, fall back to dateutil, which accepts a wide range of formats
     try:
         parsed_date = date_parser.parse(date_string)
         return parsed_date
@@ -180,6 +199,7 @@ class AdaptiveColorMappingDelegate(QtWidgets.QStyledItemDelegate):
 
     Class Constants:
         COLOR_DICT: A dictionary that maps color names to corresponding QColor objects.
+        DEADLINE_COLOR_PALETTE: A dictionary that maps day differences to deadline colors.
 
     Attributes:
         min_value (Optional[Number]): The minimum value of the range.
@@ -203,6 +223,14 @@ class AdaptiveColorMappingDelegate(QtWidgets.QStyledItemDelegate):
         'blue': QtGui.QColor(0, 120, 215),
     }
 
+    # Built once, since the palette is looked up for every date cell that is painted
+    DEADLINE_COLOR_PALETTE = {
+        0: COLOR_DICT['red'],                   # Red (today's deadline)
+        1: COLOR_DICT['light_red'],             # Slightly lighter tone for tomorrow
+        2: COLOR_DICT['light_green'],           # Light green for the day after tomorrow
+        **dict.fromkeys(range(3, 8), COLOR_DICT['dark_green']),   # Dark green for the next 3-7 days
+    }
+
     # Initialization and Setup
     # ------------------------
     def __init__(
@@ -212,8 +240,8 @@ class AdaptiveColorMappingDelegate(QtWidgets.QStyledItemDelegate):
         max_value: Optional[Number] = None,
         min_color: QtGui.QColor = COLOR_DICT['pastel_green'],
         max_color: QtGui.QColor = COLOR_DICT['pastel_red'],
-        keyword_color_dict: Dict[str, QtGui.QColor] = dict(),
-        date_color_dict: Dict[str, QtGui.QColor] = dict(),
+        keyword_color_dict: Optional[Dict[str, QtGui.QColor]] = None,
+        date_color_dict: Optional[Dict[str, QtGui.QColor]] = None,
         date_format: str = '%Y-%m-%d',
     ):
         """Initialize the AdaptiveColorMappingDelegate.
@@ -227,7 +255,9 @@ class AdaptiveColorMappingDelegate(QtWidgets.QStyledItemDelegate):
             max_color (QtGui.QColor, optional): The color corresponding to the maximum value.
                 Default is a pastel red.
             keyword_color_dict (Dict[str, QtGui.QColor], optional): A dictionary that maps
-                keywords to specific colors. Default is an empty dictionary.
+                keywords to specific colors. Default is None, which uses an empty dictionary.
+            date_color_dict (Dict[str, QtGui.QColor], optional): A dictionary that maps
+                dates to specific colors. Default is None, which uses an empty dictionary.
             date_format (str, optional): The date format string. Default is '%Y-%m-%d'.
         """
         # Initialize the super class
@@ -238,8 +268,9 @@ class AdaptiveColorMappingDelegate(QtWidgets.QStyledItemDelegate):
         self.max_value = max_value
         self.min_color = min_color
         self.max_color = max_color
-        self.keyword_color_dict = keyword_color_dict
-        self.date_color_dict = date_color_dict
+        # Create new dictionaries if not given, so instances never share the same default dictionary
+        self.keyword_color_dict = keyword_color_dict if keyword_color_dict is not None else dict()
+        self.date_color_dict = date_color_dict if date_color_dict is not None else dict()
         self.date_format = date_format
 
     # Private Methods
@@ -259,12 +290,16 @@ class AdaptiveColorMappingDelegate(QtWidgets.QStyledItemDelegate):
         # Normalize the value between 0 and 1
         normalized_value = (value - self.min_value) / (self.max_value - self.min_value)
 
+        # Get the channels of both colors with a single call per color
+        min_red, min_green, min_blue, _ = self.min_color.getRgbF()
+        max_red, max_green, max_blue, _ = self.max_color.getRgbF()
+
         # Interpolate between the min_color and max_color based on the normalized value
         color = QtGui.QColor()
         color.setRgbF(
-            self.min_color.redF() + (self.max_color.redF() - self.min_color.redF()) * normalized_value,
-            self.min_color.greenF() + (self.max_color.greenF() - self.min_color.greenF()) * normalized_value,
-            self.min_color.blueF() + (self.max_color.blueF() - self.min_color.blueF()) * normalized_value
+            min_red + (max_red - min_red) * normalized_value,
+            min_green + (max_green - min_green) * normalized_value,
+            min_blue + (max_blue - min_blue) * normalized_value
         )
 
         return color
@@ -307,20 +342,12 @@ class AdaptiveColorMappingDelegate(QtWidgets.QStyledItemDelegate):
         Returns:
             QtGui.QColor: The color corresponding to the difference.
         """
-        color_palette = {
-            0: self.COLOR_DICT['red'],              # Red (today's deadline)
-            1: self.COLOR_DICT['light_red'],        # Slightly lighter tone for tomorrow
-            2: self.COLOR_DICT['light_green'],      # Light green for the day after tomorrow
-            **{diff: self.COLOR_DICT['dark_green'] 
-               for diff in range(3, 8)},            # Dark green for the next 3-7 days
-        }
-
         if difference >= 7:
             # Green for dates more than 7 days away
             return self.COLOR_DICT['green']
         else:
             # Blue for other dates
-            return color_palette.get(difference, self.COLOR_DICT['blue'])
+            return self.DEADLINE_COLOR_PALETTE.get(difference, self.COLOR_DICT['blue'])
 
     def _get_date_color(self, date_value: str, is_pastel_color: bool = True) -> QtGui.QColor:
         """Get the color based on the given date value.
@@ -340,8 +367,15 @@ class AdaptiveColorMappingDelegate(QtWidgets.QStyledItemDelegate):
         # Get the current date
         today = datetime.date.today()
 
+        # If the date format is ISO 8601, try the faster datetime.date.fromisoformat first
+        if self.date_format == ISO_DATE_FORMAT:
+            try:
+                parsed_date = datetime.date.fromisoformat(date_value)
+            except ValueError:
+                # Fall back to strptime, which also accepts non zero-padded values
+                parsed_date = datetime.datetime.strptime(date_value, self.date_format).date()
         # If a date format is specified, use datetime.strptime to parse the date string
-        if self.date_format:
+        elif self.date_format:
             # Use datetime.strptime to parse the date string
             parsed_date = datetime.datetime.strptime(date_value, self.date_format).date()
         else:
@@ -372,13 +406,18 @@ class AdaptiveColorMappingDelegate(QtWidgets.QStyledItemDelegate):
             model_index (QtCore.QModelIndex): The model index of the item to be painted.
         """
         # Retrieve the value from the model using UserRole
-        value = model_index.data(QtCore.Qt.ItemDataRole.UserRole)
+        value = model_index.data(USER_ROLE)
 
         if isinstance(value, Number):
             # If the value is numerical, use _interpolate_color
             color = self._interpolate_color(value)
         elif isinstance(value, str):
-            if not parse_date(value):
+            # Use the cached color if the value has been painted before, skipping the date parsing
+            if value in self.date_color_dict:
+                color = self.date_color_dict[value]
+            elif value in self.keyword_color_dict:
+                color = self.keyword_color_dict[value]
+            elif not parse_date(value):
                 # If the value is a string and not a date, use _get_keyword_color
                 color = self._get_keyword_color(value)
             else:
@@ -453,8 +492,8 @@ class TreeWidgetItem(QtWidgets.QTreeWidgetItem):
         """
         # Iterate through each column in the item
         for column_index, value in enumerate(item_data_list):
-            # Set the value for the column in the UserRole data
-            self.set_value(column_index, value)
+            # Set the value for the column in the UserRole data, directly since the column is always an index here
+            self.setData(column_index, USER_ROLE, value)
 
     # Extended Methods
     # ----------------
@@ -515,9 +554,9 @@ class TreeWidgetItem(QtWidgets.QTreeWidgetItem):
         column_index = self.treeWidget().get_column_index(column) if isinstance(column, str) else column
 
         # Get the UserRole data for the column
-        value = self.data(column_index, QtCore.Qt.ItemDataRole.UserRole)
+        value = self.data(column_index, USER_ROLE)
         # Fallback to the DisplayRole data if UserRole data is None
-        value = self.data(column_index, QtCore.Qt.ItemDataRole.DisplayRole) if value is None else value
+        value = self.data(column_index, DISPLAY_ROLE) if value is None else value
 
         return value
 
@@ -532,7 +571,7 @@ class TreeWidgetItem(QtWidgets.QTreeWidgetItem):
         column_index = self.treeWidget().get_column_index(column) if isinstance(column, str) else column
 
         # Set the value for the column in the UserRole data
-        self.setData(column_index, QtCore.Qt.ItemDataRole.UserRole, value)
+        self.setData(column_index, USER_ROLE, value)
 
     # Special Methods
     # ---------------
@@ -567,7 +606,7 @@ class TreeWidgetItem(QtWidgets.QTreeWidgetItem):
         # If the UserRole data is None, fallback to DisplayRole data
         if other_data is None:
             # Get the DisplayRole data for the column of the other item
-            other_data = other_item.data(column, QtCore.Qt.DisplayRole)
+            other_data = other_item.data(column, DISPLAY_ROLE)
 
         # If both UserRole data are None, compare their texts
         if self_data is None and other_data is None:
@@ -596,6 +635,8 @@ class ColumnListWidget(QtWidgets.QListWidget):
 
         self.tree_widget = parent
         self.name_to_item = dict()
+        # Whether the header sections are being moved from this list, to skip rebuilding the list on each move
+        self._is_moving_sections = False
 
         self.tree_widget.header().sectionMoved.connect(self.update_list)
         self.model().rowsMoved.connect(self.update_tree_widget)
@@ -603,13 +644,21 @@ class ColumnListWidget(QtWidgets.QListWidget):
 
         self.update_list()
 
+    @QtCore.pyqtSlot()
     def update_tree_widget(self):
         item_texts = [self.item(i).text() for i in range(self.tree_widget.columnCount())]
+        header = self.tree_widget.header()
 
-        for i, item_text in enumerate(item_texts):
-            column_index = self.tree_widget.get_column_index(item_text)
-            self.tree_widget.header().moveSection(self.tree_widget.header().visualIndex(column_index), i)
+        # Move the sections without rebuilding the list on every emitted sectionMoved, the list already has the new order
+        self._is_moving_sections = True
+        try:
+            for i, item_text in enumerate(item_texts):
+                column_index = self.tree_widget.get_column_index(item_text)
+                header.moveSection(header.visualIndex(column_index), i)
+        finally:
+            self._is_moving_sections = False
 
+    @QtCore.pyqtSlot(QtWidgets.QListWidgetItem)
     def set_column_visibility(self, item):
         column_name = item.text()
         is_hidden = item.checkState() == QtCore.Qt.CheckState.Unchecked
@@ -617,7 +666,11 @@ class ColumnListWidget(QtWidgets.QListWidget):
         
         self.tree_widget.setColumnHidden(column_index, is_hidden)
 
+    @QtCore.pyqtSlot()
     def update_list(self):
+        if self._is_moving_sections:
+            return
+
         self.clear()
         logical_indexes = [self.get_logical_index(i) for i in range(self.tree_widget.columnCount())]
         header_names = [self.tree_widget.column_name_list[i] for i in logical_indexes]
@@ -656,8 +709,20 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
             It's used for scrolling functionality when the middle button is pressed and the mouse is moved.
         _middle_button_prev_pos (QtCore.QPoint): The previous position of the mouse when the middle button was pressed.
         _middle_button_start_pos (QtCore.QPoint): The initial position of the mouse when the middle button was pressed.
-        _mouse_move_timestamp (float): The timestamp of the last mouse movement.
+        _move_timer (QtCore.QElapsedTimer): The monotonic timer used for mouse move and animation timing.
+        _mouse_move_ns (int): The timestamp of the last mouse movement, in nanoseconds elapsed on `_move_timer`.
+        _active_scroll_animations (List[QtCore.QPropertyAnimation]): The scroll momentum animations currently running.
+        _move_accum (QtCore.QPoint): The scroll delta accumulated since the last committed scroll update.
+        _move_last (QtCore.QElapsedTimer): The timer measuring the time since the last committed scroll update.
+        _scroll_flush_timer (QtCore.QTimer): The single-shot timer applying the delta left over when the mouse stops moving.
     """
+    # Class constants
+    # ---------------
+    # Style sheet shared by the section labels of the header context menu
+    LABEL_STYLE_SHEET = 'color: rgb(144, 144, 144); padding: 0px;'
+    # Minimum interval in milliseconds between scroll updates while dragging with the middle button (~60 Hz)
+    SCROLL_UPDATE_INTERVAL_MS = 16
+
     # Signals emitted by the GroupableTreeWidget
     ungrouped_all = QtCore.pyqtSignal()
     grouped_by_column = QtCore.pyqtSignal(str)
@@ -665,14 +730,14 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
     # Initialization and Setup
     # ------------------------
     def __init__(self, parent: QtWidgets.QWidget = None, 
-                       column_name_list: List[str] = list(), 
-                       id_to_data_dict: Dict[int, Dict[str, str]] = dict()):
+                       column_name_list: Optional[List[str]] = None, 
+                       id_to_data_dict: Optional[Dict[int, Dict[str, str]]] = None):
         # Call the parent class constructor
         super().__init__(parent)
 
-        # Store the column names and data dictionary for later use
-        self.column_name_list = column_name_list
-        self.id_to_data_dict = id_to_data_dict
+        # Store the column names and data dictionary for later use, creating new ones if not given
+        self.column_name_list = column_name_list if column_name_list is not None else list()
+        self.id_to_data_dict = id_to_data_dict if id_to_data_dict is not None else dict()
 
         # Set up the initial values
         self._setup_attributes()
@@ -702,11 +767,33 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         # Initial position of the middle mouse button
         self._middle_button_start_pos = QtCore.QPoint()
 
-        # Timestamp of the last mouse move event
-        self._mouse_move_timestamp = float()
+        # Monotonic timer used for mouse move timestamps and scroll animation timing
+        self._move_timer = QtCore.QElapsedTimer()
+        self._move_timer.start()
+        # Timestamp of the last mouse move event, in nanoseconds elapsed on the move timer
+        self._mouse_move_ns = 0
+
+        # Pending scroll delta accumulated from middle button mouse moves
+        self._move_accum = QtCore.QPoint()
+        # Timer of the last committed scroll update, used to throttle updates to the display refresh rate
+        self._move_last = QtCore.QElapsedTimer()
+        self._move_last.start()
+        # Single-shot timer to apply the remaining delta when no further mouse move commits it
+        self._scroll_flush_timer = QtCore.QTimer(self)
+        self._scroll_flush_timer.setSingleShot(True)
 
         self._row_height = 24
 
+        # Queue of group items waiting to be expanded incrementally after grouping
+        self._pending_expand_items = deque()
+        # Single-shot timer driving the incremental expansion, one group per event loop turn
+        self._expand_timer = QtCore.QTimer(self)
+        self._expand_timer.setSingleShot(True)
+        self._expand_timer.setInterval(0)
+
+        # Scroll momentum animations that are currently running
+        self._active_scroll_animations = list()
+
     def _setup_ui(self):
         """Set up the UI for the widget, including creating widgets and layouts.
         """
@@ -744,6 +831,11 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
 
         self.header().sortIndicatorChanged.connect(lambda _: self.set_row_height(self._row_height))
 
+        # Connect the scroll flush timer to apply the remaining middle button scroll delta
+        self._scroll_flush_timer.timeout.connect(self._flush_scroll_accum)
+        # Connect the expand timer to expand the next pending group item
+        self._expand_timer.timeout.connect(self._expand_next_group)
+
         # Key Binds
         # ---------
         # Create a shortcut for the copy action and connect its activated signal
@@ -752,6 +844,7 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
 
     # Private Methods
     # ---------------
+    @QtCore.pyqtSlot(QtCore.QPoint)
     def _on_header_context_menu(self, pos: QtCore.QPoint) -> None:
         """Show a context menu for the header of the tree widget.
 
@@ -788,6 +881,9 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         else:
             menu = QtWidgets.QMenu(self)
 
+        # Delete the menu with its actions and widgets once it is closed, instead of keeping one per right click
+        menu.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+
         self.add_label_action(menu, 'Grouping')
 
         # Create the 'Group by this column' action and connect it to the 'group_by_column' method. Pass in the selected column as an argument.
@@ -825,10 +921,8 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         show_hide_column = menu.addMenu('Show/Hide Columns')
         menu.addMenu(show_hide_column)
 
-        self.column_list_widget = ColumnListWidget(self)
-        action = QtWidgets.QWidgetAction(self)
-        action.setDefaultWidget(self.column_list_widget)
-        show_hide_column.addAction(action)
+        # Create the column list only when the submenu is about to be shown
+        show_hide_column.aboutToShow.connect(lambda: self._populate_column_list_menu(show_hide_column))
 
         hide_this_column = menu.addAction('Hide This Column')
         hide_this_column.triggered.connect(lambda: self.hideColumn(column))
@@ -843,9 +937,7 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
     def add_label_action(self, parent_menu: QtWidgets.QMenu, text: str):
         label = QtWidgets.QLabel(text, parent_menu)
         label.setDisabled(True)
-        label.setStyleSheet(
-            'color: rgb(144, 144, 144); padding: 0px;'
-        )
+        label.setStyleSheet(self.LABEL_STYLE_SHEET)
 
         layout = QtWidgets.QVBoxLayout()
         layout.addWidget(label)
@@ -858,11 +950,27 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
 
         parent_menu.addAction(action)
 
-    def _create_item_groups(self, data: List[str]) -> Dict[str, List[TreeWidgetItem]]:
-        """Group the data into a dictionary mapping group names to lists of tree items.
+    def _populate_column_list_menu(self, menu: QtWidgets.QMenu) -> None:
+        """Add the column list widget to the given menu, if it has not been added yet.
 
         Args:
-            data (List[str]): The data to be grouped.
+            menu (QtWidgets.QMenu): The 'Show/Hide Columns' menu to populate.
+        """
+        # Return if the menu has already been populated
+        if not menu.isEmpty():
+            return
+
+        # Create the column list widget and add it to the menu, parenting the action to the menu so both are deleted with it
+        self.column_list_widget = ColumnListWidget(self)
+        action = QtWidgets.QWidgetAction(menu)
+        action.setDefaultWidget(self.column_list_widget)
+        menu.addAction(action)
+
+    def _create_item_groups(self, column: int) -> Dict[str, List[TreeWidgetItem]]:
+        """Group the top-level items into a dictionary mapping group names to lists of tree items.
+
+        Args:
+            column (int): The index of the column whose values are used as group names.
 
         Returns:
             Dict[str, List[TreeWidgetItem]]: A dictionary mapping group names to lists of tree items.
@@ -870,14 +978,17 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         # Create a dictionary to store the groups
         groups = {}
 
-        # Group the data
-        for i, item_data in enumerate(data):
+        # Bind the lookup method locally to avoid repeated attribute resolution in the loop
+        top_level_item = self.topLevelItem
+
+        # Group the items in a single pass over the top-level items
+        for row in range(self.topLevelItemCount()):
+            item = top_level_item(row)
+
             # If the data is empty, add it to the '_others' group
-            if not item_data:
-                item_data = '_others'
+            item_data = item.data(column, USER_ROLE) or '_others'
 
             # Add the tree item to the appropriate group
-            item = self.topLevelItem(i)
             if item_data in groups:
                 groups[item_data].append(item)
             else:
@@ -885,6 +996,91 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
 
         return groups
 
+    def _get_row_path(self, model_index: QtCore.QModelIndex) -> Tuple[int, ...]:
+        """Get the path of row numbers from the top level down to the given model index.
+
+        The paths sort in the same order as the items appear in the tree, without traversing the tree.
+
+        Args:
+            model_index (QtCore.QModelIndex): The model index to get the row path for.
+
+        Returns:
+            Tuple[int, ...]: The row numbers of the ancestors and the item itself, starting at the top level.
+        """
+        # Collect the row numbers walking up the parent chain
+        row_path = list()
+        while model_index.isValid():
+            row_path.append(model_index.row())
+            model_index = model_index.parent()
+
+        # Return the row numbers ordered from the top level down
+        return tuple(reversed(row_path))
+
+    @QtCore.pyqtSlot()
+    def _expand_next_group(self) -> None:
+        """Expand the next pending group item and schedule the expansion of the following one.
+        """
+        # Expand the next group item, if any
+        if self._pending_expand_items:
+            group_item = self._pending_expand_items.popleft()
+
+            # Block signals while expanding, so itemExpanded does not expand the selected items with every group
+            is_signals_blocked = self.blockSignals(True)
+            try:
+                group_item.setExpanded(True)
+            finally:
+                self.blockSignals(is_signals_blocked)
+
+        # Schedule the next expansion, or resize the first column once all groups are expanded
+        if self._pending_expand_items:
+            self._expand_timer.start()
+        else:
+            self.resizeColumnToContents(0)
+
+    @contextmanager
+    def _updates_disabled(self):
+        """Disable updates of the widget within the context, so it is repainted once on exit.
+
+        The previous state is restored on exit, even if an exception is raised, and nested contexts
+        keep updates disabled until the outermost one exits.
+        """
+        is_updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(is_updates_enabled)
+
+    def _stop_group_expansion(self) -> None:
+        """Stop the incremental expansion of group items and drop the group items still waiting to be expanded.
+        """
+        self._expand_timer.stop()
+        self._pending_expand_items.clear()
+
+    @QtCore.pyqtSlot()
+    def _flush_scroll_accum(self) -> None:
+        """Apply the accumulated middle button scroll delta to the scroll bars and reset the accumulator.
+        """
+        # Stop the pending flush, since the delta is applied now
+        self._scroll_flush_timer.stop()
+        # Restart the throttle timer
+        self._move_last.restart()
+
+        # Return if there is nothing to apply
+        if self._move_accum.isNull():
+            return
+
+        # Get the scroll bars
+        horizontal_scroll_bar = self.horizontalScrollBar()
+        vertical_scroll_bar = self.verticalScrollBar()
+
+        # Adjust the scroll bar values according to the accumulated mouse movement
+        horizontal_scroll_bar.setValue(horizontal_scroll_bar.value() - self._move_accum.x())
+        vertical_scroll_bar.setValue(vertical_scroll_bar.value() - self._move_accum.y())
+
+        # Reset the accumulated delta
+        self._move_accum = QtCore.QPoint()
+
     def _apply_scroll_momentum(self, velocity: QtCore.QPointF, momentum_factor: float = 0.5) -> None:
         """Applies momentum to the scroll bars based on the given velocity.
 
@@ -915,40 +1111,32 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         # Calculate the duration of the animation based on the absolute value of the momentum
         duration = min(abs(momentum) * 20, 500)
 
-        # Get the start time of the animation
-        start_time = time.time()
-
-        def _perform_scroll_animation():
-            """Animates the scrolling of the given scroll bar to the target value over the specified duration.
-
-            The animation interpolates the scroll bar value from the current value to the target value based on the elapsed time.
-            """
-            # Access the current_value variable from the enclosing scope
-            nonlocal current_value
+        # Return if there is no momentum to animate
+        if not duration:
+            return
 
-            # Stop the animation if the middle mouse button is pressed
-            if self._is_middle_button_pressed:
-                return
+        # Create an animation of the scroll bar value, deleted once it has stopped
+        animation = QtCore.QPropertyAnimation(scroll_bar, b'value', self)
+        animation.setDuration(duration)
+        animation.setStartValue(current_value)
+        animation.setEndValue(target_value)
 
-            # Calculate the elapsed time since the start of the animation
-            elapsed_time = int((time.time() - start_time) * 1000)
+        # Keep track of the animation while it is running, so it can be cancelled
+        self._active_scroll_animations.append(animation)
+        animation.finished.connect(lambda: self._active_scroll_animations.remove(animation))
 
-            # Check if the elapsed time has reached the duration
-            if elapsed_time >= duration:
-                # Animation complete
-                scroll_bar.setValue(target_value)
-                return
+        # Start the animation
+        animation.start(QtCore.QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
 
-            # Calculate the interpolated value based on elapsed time and duration
-            progress = elapsed_time / duration
-            interpolated_value = int(current_value + (target_value - current_value) * progress)
+    def _stop_scroll_animations(self) -> None:
+        """Stop all running scroll animations.
+        """
+        # Stop each running animation, which also deletes it
+        for animation in self._active_scroll_animations:
+            animation.stop()
 
-            # Update the scroll bar value and schedule the next animation frame
-            scroll_bar.setValue(interpolated_value)
-            QtCore.QTimer.singleShot(10, _perform_scroll_animation)
-
-        # Start the animation
-        _perform_scroll_animation()
+        # Clear the running animations
+        self._active_scroll_animations.clear()
 
     # Extended Methods
     # ----------------
@@ -975,6 +1163,7 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
             size_hint = self.sizeHintForColumn(column_index)
             self.topLevelItem(0).setSizeHint(column_index, QtCore.QSize(size_hint, -1))
 
+    @QtCore.pyqtSlot(QtWidgets.QTreeWidgetItem)
     def toggle_expansion_for_selected(self, item):
         """Toggles the expansion state of selected items.
 
@@ -1036,10 +1225,21 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         Returns:
             List[TreeWidgetItem]: List of `QTreeWidgetItem` objects at the specified child level.
         """
+        # Bind the lookup method locally to avoid repeated attribute resolution in the loop
+        top_level_item = self.topLevelItem
+
         # If child level is 0, return top-level items
         if not child_level:
             # return top-level items
-            return [self.topLevelItem(row) for row in range(self.topLevelItemCount())]
+            return [top_level_item(row) for row in range(self.topLevelItemCount())]
+
+        # If child level is 1, return the direct children of the top-level items without traversing the whole tree
+        if child_level == 1:
+            items = list()
+            for row in range(self.topLevelItemCount()):
+                group_item = top_level_item(row)
+                items.extend(group_item.child(child_index) for child_index in range(group_item.childCount()))
+            return items
 
         # Get all items in the tree widget
         all_items = self.get_all_items()
@@ -1055,9 +1255,11 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         """
         # Get the header of the tree widget
         header = self.header()
+        # Bind the lookup method locally to avoid repeated attribute resolution in the loop
+        is_section_hidden = header.isSectionHidden
 
         # Generate a list of the indices of the columns that are not hidden
-        column_index_list = [column_index for column_index in range(header.count()) if not header.isSectionHidden(column_index)]
+        column_index_list = [column_index for column_index in range(header.count()) if not is_section_hidden(column_index)]
 
         # Return the list of the index of a shown column in the tree widget.
         return column_index_list
@@ -1072,6 +1274,10 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         Args:
             column (int): The index of the column to apply the adaptive color mapping.
         """
+        # Skip hidden columns, computing the value range would traverse every row for nothing
+        if self.isColumnHidden(column):
+            return
+
         # Determine the child level based on the presence of a grouped column
         child_level = 1 if self.grouped_column_name else 0
 
@@ -1082,11 +1288,21 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         delegate = AdaptiveColorMappingDelegate(self, min_value, max_value)
         self.setItemDelegateForColumn(column, delegate)
 
+    @QtCore.pyqtSlot()
     def reset_all_color_adaptive_column(self):
         """Reset the color adaptive for all columns in the tree widget.
         """
-        for column in range(self.columnCount()):
-            self.setItemDelegateForColumn(column, None)
+        # Get the columns that actually have a delegate set, to avoid a viewport update for every column
+        delegated_columns = [column for column in range(self.columnCount()) if self.itemDelegateForColumn(column)]
+
+        # Return if there is nothing to reset
+        if not delegated_columns:
+            return
+
+        # Reset the delegates with updates disabled, so the viewport is repainted only once
+        with self._updates_disabled():
+            for column in delegated_columns:
+                self.setItemDelegateForColumn(column, None)
 
     def set_column_name_list(self, column_name_list: List[str]) -> None:
         """Set the names of the columns in the tree widget.
@@ -1136,15 +1352,25 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         # Store the data dictionary for later use
         self.id_to_data_dict = id_to_data_dict
 
-        # Iterate through the dictionary of items
-        for item_id, item_data in self.id_to_data_dict.items():
-            # Create a new custom QTreeWidgetItem for sorting by type of the item data, and add to the self tree widget
-            tree_item = TreeWidgetItem(self, item_data=item_data, item_id=item_id)
-            # 
-            self.id_to_tree_item[item_id] = tree_item
-
-        # Resize all columns to fit their contents
-        self.resize_to_contents()
+        # Disable updates while adding the items, so the viewport is repainted once at the end
+        with self._updates_disabled():
+            # Disable sorting while adding the items, so they are appended instead of being sorted on each insertion
+            is_sorting_enabled = self.isSortingEnabled()
+            self.setSortingEnabled(False)
+
+            try:
+                # Iterate through the dictionary of items
+                for item_id, item_data in self.id_to_data_dict.items():
+                    # Create a new custom QTreeWidgetItem for sorting by type of the item data, and add to the self tree widget
+                    tree_item = TreeWidgetItem(self, item_data=item_data, item_id=item_id)
+                    # 
+                    self.id_to_tree_item[item_id] = tree_item
+            finally:
+                # Restore sorting, which sorts all the added items at once
+                self.setSortingEnabled(is_sorting_enabled)
+
+            # Resize all columns to fit their contents
+            self.resize_to_contents()
 
     def group_by_column(self, column: int) -> None:
         """Group the items in the tree widget by the values in the specified column.
@@ -1152,54 +1378,46 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         Args:
             column (int): The index of the column to group by.
         """
-        # Ungroup all items in the tree widget
-        self.ungroup_all()
+        # Disable updates while the tree is restructured, so it is repainted once at the end
+        with self._updates_disabled():
+            # Ungroup all items in the tree widget
+            self.ungroup_all()
 
-        # Hide the grouped column
-        self.setColumnHidden(column, True)
+            # Hide the grouped column
+            self.setColumnHidden(column, True)
 
-        # Get the label for the column that we want to group by and the label for the first column 
-        self.grouped_column_name = self.headerItem().text(column)
-        first_column_label = self.headerItem().text(0)
-        
-        # Rename the first column
-        self.setHeaderLabel(f'{self.grouped_column_name} / {first_column_label}')
-        
-        # Get the data for each tree item in the column
-        data = [self.topLevelItem(row).data(column, QtCore.Qt.UserRole) for row in range(self.topLevelItemCount())]
-        
-        # Group the data and add the tree items to the appropriate group
-        groups = self._create_item_groups(data)
-
-        # Iterate through each group and its items
-        for group_name, items in groups.items():
-            # Create a new QTreeWidgetItem for the group
-            group_item = TreeWidgetItem(self, [group_name])
-            
-            # Add the items to the group item as children
-            for item in items:
-                # Save the original parent and position of the tree item
-                original_parent = item.parent()
-                original_row = original_parent.indexOfChild(item) if original_parent else self.indexOfTopLevelItem(item)
-
-                # Remove the tree item from its original parent
-                if original_parent:
-                    original_parent.takeChild(original_row)
-                else:
-                    self.takeTopLevelItem(original_row)
-
-                # Add the tree item to the group item as a child and restore its original position
-                group_item.addChild(item)
-            
-        # Expand all items
-        self.expandAll()
-
-        # Resize first columns to fit their contents
-        self.resizeColumnToContents(0)
+            # Get the label for the column that we want to group by and the label for the first column 
+            self.grouped_column_name = self.headerItem().text(column)
+            first_column_label = self.headerItem().text(0)
+
+            # Rename the first column
+            self.setHeaderLabel(f'{self.grouped_column_name} / {first_column_label}')
+
+            # Group the tree items by their data in the column
+            groups = self._create_item_groups(column)
+
+            # Remove all the tree items from the top level at once
+            self.invisibleRootItem().takeChildren()
+
+            # Iterate through each group and its items
+            for group_name, items in groups.items():
+                # Create a new QTreeWidgetItem for the group
+                group_item = TreeWidgetItem(self, [group_name])
+                # Queue the group item to be expanded
+                self._pending_expand_items.append(group_item)
+
+                # Add the items to the group item as children in a single insertion
+                group_item.addChildren(items)
+
+            # Expand the groups incrementally, giving the event loop a chance to process pending events between groups
+            # NOTE: The timer is owned by the widget, so regrouping restarts the same chain instead of starting another one,
+            # and the first column is resized once all groups are expanded
+            self._expand_timer.start()
 
         # Emit signal for grouped by column with column name
         self.grouped_by_column.emit(self.grouped_column_name)
         
+    @QtCore.pyqtSlot()
     def fit_column_in_view(self) -> None:
         """Adjust the width of all columns to fit the entire view.
     
@@ -1211,18 +1429,31 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         
         # Get the expected width of the columns (the width of the view minus the width of the scroll bar)
         expect_column_width = self.size().width() - self.verticalScrollBar().width()
-        # Calculate the sum of the current column widths
-        column_width_sum = sum(self.columnWidth(column) for column in range(self.columnCount()))
-        
-        # Loop until all columns fit within the expected width
+        # Get the current column widths, and calculate their sum
+        column_widths = [self.columnWidth(column) for column in range(self.columnCount())]
+        column_width_sum = sum(column_widths)
+        # Get the amount to reduce a column by on each step, at least one pixel so the loop always progresses
+        reduce_width = max(expect_column_width // 10, 1)
+
+        # Loop until all columns fit within the expected width, working on the local widths to avoid a header relayout per step
         while column_width_sum > expect_column_width:
             # Find the column with the largest width
-            largest_column = max(range(self.columnCount()), key=lambda x: self.columnWidth(x))
+            largest_column = max(range(len(column_widths)), key=column_widths.__getitem__)
+            # Stop if there is no width left to reduce
+            if not column_widths[largest_column]:
+                break
+
             # Reduce the width of the largest column by 10%
-            new_width = max(self.columnWidth(largest_column) - expect_column_width // 10, 0)
-            self.setColumnWidth(largest_column, new_width)
+            new_width = max(column_widths[largest_column] - reduce_width, 0)
             # Update the sum of the column widths
-            column_width_sum -= self.columnWidth(largest_column) - new_width
+            column_width_sum -= column_widths[largest_column] - new_width
+            column_widths[largest_column] = new_width
+
+        # Apply the new widths with updates disabled, so the view is repainted once
+        with self._updates_disabled():
+            for column, column_width in enumerate(column_widths):
+                if column_width != self.columnWidth(column):
+                    self.setColumnWidth(column, column_width)
 
     def resize_to_contents(self) -> None:
         """Resize all columns in the object to fit their contents.
@@ -1232,6 +1463,7 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
             # Resize the column to fit its contents
             self.resizeColumnToContents(column_index) 
 
+    @QtCore.pyqtSlot()
     def ungroup_all(self) -> None:
         """Ungroup all the items in the tree widget.
         """
@@ -1239,31 +1471,34 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         if not self.grouped_column_name:
             return
 
-        # Reset the header label
-        self.setHeaderLabel(self.column_name_list[0])
-        
-        # Show hidden column
-        column_index = self.get_column_index(self.grouped_column_name)
-        self.setColumnHidden(column_index, False)
+        # Drop group items still waiting to be expanded
+        self._stop_group_expansion()
 
-        # Get a list of all the top-level items in the tree widget
-        group_item_list = [self.topLevelItem(i) for i in range(self.topLevelItemCount())]
+        # Disable updates while the tree is restructured, which stay disabled when ungrouping is part of a regrouping
+        with self._updates_disabled():
+            # Reset the header label
+            self.setHeaderLabel(self.column_name_list[0])
 
-        # Iterate through all the top-level items in the tree widget
-        for group_item in group_item_list:
+            # Show hidden column
+            column_index = self.get_column_index(self.grouped_column_name)
+            self.setColumnHidden(column_index, False)
 
-            # Remove all of its children and add them as top-level items
-            child_items = group_item.takeChildren()
-            self.addTopLevelItems(child_items)
+            # Remove all the group items from the top level at once
+            group_item_list = self.invisibleRootItem().takeChildren()
 
-            # Remove the group item from the top-level items
-            self.takeTopLevelItem(self.indexOfTopLevelItem(group_item))
+            # Collect the children of all the group items
+            child_items = list()
+            for group_item in group_item_list:
+                child_items.extend(group_item.takeChildren())
 
-        # Clear the grouped column label
-        self.grouped_column_name = str()
+            # Add the children back as top-level items in a single insertion
+            self.addTopLevelItems(child_items)
+
+            # Clear the grouped column label
+            self.grouped_column_name = str()
 
-        # Resize first columns to fit their contents
-        self.resizeColumnToContents(0)
+            # Resize first columns to fit their contents
+            self.resizeColumnToContents(0)
 
         # Emit signal for ungrouped all
         self.ungrouped_all.emit()
@@ -1277,28 +1512,19 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         Returns:
             List[TreeWidgetItem]: A list containing all the items in the tree widget.
         """
-        def traverse_items(item: TreeWidgetItem):
-            # Recursively traverse the children of the current item
-            for child_index in range(item.childCount()):
-                # Get the child item at the current index
-                child = item.child(child_index)
+        # Create an iterator that walks the whole tree in a depth-first manner
+        iterator = QtWidgets.QTreeWidgetItemIterator(self)
 
-                # Add the current child item to the list
-                items.append(child)
-
-                # Recursively traverse the children of the current child item
-                traverse_items(child)
-
-        # Get the root item of the tree widget
-        root = self.invisibleRootItem()
-
-        # Traverse the items in a depth-first manner and collect them in a list
+        # Collect the items in a list
         items = list()
-        traverse_items(root)
+        while iterator.value():
+            items.append(iterator.value())
+            iterator += 1
 
         # Return the list of items
         return items
 
+    @QtCore.pyqtSlot()
     def copy_selected_cells(self):
         # NOTE: For refactoring
         #
@@ -1306,42 +1532,30 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         model = self.selectionModel()
         model_indexes = model.selectedIndexes()
 
-        all_items = self.get_all_items()
-        # Sort the cells based on their global row and column
-        sorted_indexes = sorted(
-            model_indexes, 
-            key=lambda model_index: (
-                all_items.index(self.itemFromIndex(model_index)),
-                model_index.column()
-                )
-            )
-
-        cell_dict = dict()
-        column_set = set()
-
-        for model_index in sorted_indexes:
-            tree_item = self.itemFromIndex(model_index)
+        # Pair each cell with its global row, computed once per cell
+        cells = [(self._get_row_path(model_index), model_index) for model_index in model_indexes]
+
+        # Map each distinct row and column to its position in the copied grid
+        row_to_position = {row: position for position, row in enumerate(sorted({row for row, _ in cells}))}
+        column_to_position = {
+            column: position
+            for position, column in enumerate(sorted({model_index.column() for _, model_index in cells}))
+        }
 
-            global_row = all_items.index(tree_item)
+        # Pre-size the grid with empty cells, then fill in the selected cells in a single pass
+        grid = [[str()] * len(column_to_position) for _ in row_to_position]
+
+        for global_row, model_index in cells:
+            tree_item = self.itemFromIndex(model_index)
             column = model_index.column()
 
             cell_value = tree_item.get_value(column)
             cell_text = str() if cell_value is None else str(cell_value)
             cell_text = f'"{cell_text}"' if '\t' in cell_text or '\n' in cell_text else cell_text
 
-            cell_dict.setdefault(global_row, dict())
-            cell_dict[global_row][column] = cell_text
-            column_set.add(column)
-
-        for row_dict in cell_dict.values():
-            for column in column_set:
-                row_dict.setdefault(column, str())
-
-        row_texts = list()
-        for row_dict in cell_dict.values():
-            row_text = '\t'.join(row_dict[column] for column in sorted(column_set))
-            row_texts.append(row_text)
+            grid[row_to_position[global_row]][column_to_position[column]] = cell_text
 
+        row_texts = ['\t'.join(row_cells) for row_cells in grid]
         full_text = '\n'.join(row_texts)
 
         clipboard = QtWidgets.QApplication.clipboard()
@@ -1379,6 +1593,9 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
     # Event Handling or Override Methods
     # ----------------------------------
     def clear(self):
+        # Drop group items still waiting to be expanded, since their C++ objects are deleted by clearing
+        self._stop_group_expansion()
+
         self.id_to_tree_item.clear()
         super().clear()
 
@@ -1395,6 +1612,8 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         if event.button() == QtCore.Qt.MouseButton.MiddleButton:
             # Set middle button press flag to True
             self._is_middle_button_pressed = True
+            # Cancel any scroll momentum still in flight
+            self._stop_scroll_animations()
             # Record the initial position where mouse button is pressed
             self._middle_button_start_pos = event.pos()
             # Change the cursor to SizeAllCursor
@@ -1416,9 +1635,12 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         if event.button() == QtCore.Qt.MouseButton.MiddleButton:
             # Set middle button press flag to False
             self._is_middle_button_pressed = False
+            # Apply any scroll delta that has not been committed yet
+            self._flush_scroll_accum()
             # Calculate the velocity based on the change in mouse position and the elapsed time
             # NOTE: The + 0.01 is added to avoid division by zero
-            velocity = (event.pos() - self._middle_button_prev_pos) / ((time.time() - self._mouse_move_timestamp + 0.01))
+            elapsed_seconds = (self._move_timer.nsecsElapsed() - self._mouse_move_ns) / 1e9
+            velocity = (event.pos() - self._middle_button_prev_pos) / (elapsed_seconds + 0.01)
             # Apply momentum based on velocity
             self._apply_scroll_momentum(velocity)
             # Restore the cursor to default
@@ -1438,23 +1660,24 @@ class GroupableTreeWidget(QtWidgets.QTreeWidget):
         """
         # Check if middle mouse button is pressed
         if self._is_middle_button_pressed:
-            # Calculate the change in mouse position
+            # Calculate the change in mouse position and accumulate it
             delta = event.pos() - self._middle_button_start_pos
+            self._move_accum += delta
 
-            # Get the scroll bars
-            horizontal_scroll_bar = self.horizontalScrollBar()
-            vertical_scroll_bar = self.verticalScrollBar()
-
-            # Adjust the scroll bar values according to mouse movement
-            horizontal_scroll_bar.setValue(horizontal_scroll_bar.value() - int(delta.x()))
-            vertical_scroll_bar.setValue(vertical_scroll_bar.value() - int(delta.y()))
+            # Commit the accumulated delta at most once per display refresh interval
+            elapsed_ms = self._move_last.elapsed()
+            if elapsed_ms >= self.SCROLL_UPDATE_INTERVAL_MS:
+                self._flush_scroll_accum()
+            # Otherwise, schedule the remaining delta to be applied at the end of the interval, in case the mouse stops here
+            elif not self._scroll_flush_timer.isActive():
+                self._scroll_flush_timer.start(self.SCROLL_UPDATE_INTERVAL_MS - elapsed_ms)
 
             # Update the previous and start positions of the middle mouse button
             self._middle_button_prev_pos = self._middle_button_start_pos
             self._middle_button_start_pos = event.pos()
 
             # Set the timestamp of the last mouse move event
-            self._mouse_move_timestamp = time.time()
+            self._mouse_move_ns = self._move_timer.nsecsElapsed()
         else:
             # If middle button is not pressed, call the parent class method to handle the event
             super().mouseMoveEvent(event)
@@ -1,41 +1,18 @@
-from typing import Callable, Optional
+from typing import Optional
 from PyQt5 import QtWidgets, QtCore, QtGui
 
-class MoveEventFilter(QtCore.QObject):
-    def __init__(self, method: Callable, parent: QtCore.QObject = None):
-        """Event filter to intercept move events.
-
-        Args:
-            method (Callable): A callable object that will be called when a move event occurs.
-            parent (QtCore.QObject): The parent QObject. Defaults to None.
-        """
-        super().__init__(parent)
-        self.method = method
-
-    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
-        """Filters and handles the events for the given object.
-
-        Args:
-            obj (QtCore.QObject): The QObject being filtered.
-            event (QtCore.QEvent): The QEvent being filtered.
-
-        Returns:
-            bool: True if the event was handled, False otherwise.
-        """
-        if event.type() == QtCore.QEvent.Type.Move:
-            self.method()
-            return True
-        return super().eventFilter(obj, event)
-
 class PopupWidget(QtWidgets.QWidget):
     """A popup widget that contains a tree widget.
 
     Attributes:
         _relative_offset (QtCore.QPoint): The relative offset between the popup widget and the top parent widget.
+        _pending_delta (QtCore.QPoint): The drag delta that has not been applied to the popup widget position yet.
     """
     # Class constants
     # ---------------
     INITIAL_POSITION_OFFSET = QtCore.QPoint(-140, 30)
+    # Interval in milliseconds used to coalesce moves while dragging
+    MOVE_INTERVAL_MS = 8
 
     # Initialization and Setup
     # ------------------------
@@ -67,6 +44,17 @@ class PopupWidget(QtWidgets.QWidget):
         # Relative offset between the popup widget and the top parent widget
         self._relative_offset = QtCore.QPoint(0, 0)
 
+        # Last known position of the top parent widget
+        self._last_parent_pos = QtCore.QPoint()
+
+        # Drag delta accumulated since the popup widget was last moved
+        self._pending_delta = QtCore.QPoint(0, 0)
+
+        # Create a timer to coalesce drag moves into at most one move per interval
+        self._move_timer = QtCore.QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(self.MOVE_INTERVAL_MS)
+
         # Create an opacity animation for visual effects
         self._opacity_animation = QtCore.QPropertyAnimation(self, b'windowOpacity')
         self._opacity_animation.setDuration(200)
@@ -104,16 +92,18 @@ class PopupWidget(QtWidgets.QWidget):
         # Connect the clicked signal of the close button to the close method
         self.close_button.clicked.connect(self.close)
 
+        # Connect the timeout signal of the move timer to apply the accumulated drag delta
+        self._move_timer.timeout.connect(self._flush_move)
+
         # Assign mouse event handlers to the widget
         self.widget.mousePressEvent = self.mousePressEvent
         self.widget.mouseMoveEvent = self.mouseMoveEvent
         self.widget.mouseReleaseEvent = self.mouseReleaseEvent
 
-        # Create an event filter to handle move events of the top parent
-        event_filter = MoveEventFilter(self._update_position, self.top_parent)
-
-        # Install the event filter on the top parent widget
-        self.top_parent.installEventFilter(event_filter)
+        # Install the popup widget as an event filter on the top parent to follow its moves
+        # NOTE: Unlike overriding the top parent's moveEvent, this also works once the top parent is shown,
+        # and Qt removes the filter when the popup widget is destroyed
+        self.top_parent.installEventFilter(self)
 
     # Private Methods
     # ---------------
@@ -124,28 +114,74 @@ class PopupWidget(QtWidgets.QWidget):
             QtWidgets.QWidget or None: The top-level parent widget, or None if not found.
         """
         # Get the immediate parent widget of the popup widget
-        current_parent = self.parent()
+        parent = self.parent()
 
-        # Traverse up the parent hierarchy until reaching the top-level parent
-        while current_parent and current_parent.parent():
-            current_parent = current_parent.parent()
+        # Fall back to the active window if the popup widget has no parent
+        if parent is None:
+            return QtWidgets.QApplication.activeWindow()
+
+        # Get the top-level window of the parent in a single call, instead of traversing up the parent hierarchy
+        return parent.window()
+
+    def _animate_opacity(self, end_value: float):
+        """Animate the window opacity of the popup widget to the given value.
+
+        The animation is not restarted if it is already heading to the value or the value is already reached,
+        so no opacity updates are produced for nothing.
+
+        Args:
+            end_value (float): The window opacity to animate to.
+        """
+        # Return if the animation is already running towards the end value
+        if self._opacity_animation.state() == QtCore.QAbstractAnimation.State.Running and self._opacity_animation.endValue() == end_value:
+            return
 
-        return current_parent
+        # Return if the window opacity is already at the end value
+        if self.windowOpacity() == end_value:
+            return
+
+        # Set the end value and start the opacity animation
+        self._opacity_animation.setEndValue(end_value)
+        self._opacity_animation.start()
+
+    @QtCore.pyqtSlot()
+    def _flush_move(self):
+        """Move the popup widget by the accumulated drag delta and reset it.
+        """
+        # Return if there is nothing to apply
+        if self._pending_delta.isNull():
+            return
+
+        # Move the popup widget by the accumulated delta
+        self.move(self.pos() + self._pending_delta)
+
+        # Reset the accumulated delta
+        self._pending_delta = QtCore.QPoint(0, 0)
 
     def _update_relative_offset(self):
         """Update the relative offset between the popup widget and the parent widget.
         """
+        # Store the position of the top parent the offset is relative to
+        self._last_parent_pos = self.top_parent.pos()
+
         # Calculate the relative offset by subtracting the parent's position from the popup widget's position
-        self._relative_offset = self.pos() - self.top_parent.pos()
+        self._relative_offset = self.pos() - self._last_parent_pos
 
     def _update_position(self):
         """Update the position of the popup widget based on the button's location and the relative offset.
         """
-        # Calculate the new position by adding the relative offset to the parent's position
-        parent_pos = self.top_parent.pos() + self._relative_offset
+        # Get the position of the top parent once
+        top_parent_pos = self.top_parent.pos()
+
+        # Return if the top parent has not moved since the last update
+        if top_parent_pos == self._last_parent_pos:
+            return
+
+        # Store the position of the top parent
+        self._last_parent_pos = top_parent_pos
 
-        # Move the popup widget to the new position
-        self.move(parent_pos)
+        # Move the popup widget to the new position by adding the relative offset to the parent's position
+        self.move(top_parent_pos + self._relative_offset)
 
     def _set_initial_position(self):
         """Set the initial position of the popup widget based on the instance's position.
@@ -158,16 +194,30 @@ class PopupWidget(QtWidgets.QWidget):
 
     # Event Handling or Override Methods
     # ----------------------------------
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Follow the top parent widget when it moves.
+
+        Args:
+            obj (QtCore.QObject): The QObject being filtered.
+            event (QtCore.QEvent): The QEvent being filtered.
+
+        Returns:
+            bool: Always False, so the event is still delivered to the top parent.
+        """
+        # Update the position of the popup widget when the top parent is moved
+        if obj is self.top_parent and event.type() == QtCore.QEvent.Type.Move:
+            self._update_position()
+
+        return False
+
     def enterEvent(self, event: QtGui.QEnterEvent):
         """Event handler for when the mouse enters the popup widget.
 
         Args:
             event (QtCore.QEvent): The mouse enter event.
         """
-        #  Sets the end value of the opacity animation to 1.0 for full opacity.
-        self._opacity_animation.setEndValue(1.0)
-        # Starts the opacity animation.
-        self._opacity_animation.start()
+        # Animates the opacity to 1.0 for full opacity.
+        self._animate_opacity(1.0)
 
         # Calls the base class implementation to handle the event.
         super().enterEvent(event)
@@ -178,10 +228,8 @@ class PopupWidget(QtWidgets.QWidget):
         Args:
             event (QtCore.QEvent): The mouse leave event.
         """
-        # Sets the end value of the opacity animation to 0.5 for semi-opacity.
-        self._opacity_animation.setEndValue(0.8)
-        # Starts the opacity animation.
-        self._opacity_animation.start()
+        # Animates the opacity to 0.8 for semi-opacity.
+        self._animate_opacity(0.8)
 
         # Calls the base class implementation to handle the event.
         super().leaveEvent(event)
@@ -226,15 +274,16 @@ class PopupWidget(QtWidgets.QWidget):
         """
         # If dragging is in progress, the popup widget is moved accordingly to simulate dragging.
         if self._is_dragging:
-            # Calculate the delta between the current mouse position and the initial drag start position
-            delta = event.globalPos() - self._drag_start_position
-
-            # Move the popup widget to the new position
-            self.move(self.pos() + delta)
+            # Accumulate the delta between the current mouse position and the initial drag start position
+            self._pending_delta += event.globalPos() - self._drag_start_position
 
             # Update the drag start position to the current mouse position
             self._drag_start_position = event.globalPos()
 
+            # Schedule a single move for the accumulated delta
+            if not self._move_timer.isActive():
+                self._move_timer.start()
+
         # Call the base class implementation to handle the event
         super().mouseMoveEvent(event)
 
@@ -249,6 +298,10 @@ class PopupWidget(QtWidgets.QWidget):
             # Stop dragging by setting the _is_dragging flag to False
             self._is_dragging = False
 
+            # Apply any pending drag delta right away
+            self._move_timer.stop()
+            self._flush_move()
+
             # Update the relative offset between the popup widget and the parent widget
             self._update_relative_offset()
         # If a different mouse button is released, the base class implementation is called to handle the event.
@@ -16,8 +16,14 @@ class ScalableView(QtWidgets.QGraphicsView):
         min_zoom_level (float): The minimum zoom level allowed for the view.
         max_zoom_level (float): The maximum zoom level allowed for the view.
         current_zoom_level (float): The current zoom level of the view.
+        graphic_item (QtWidgets.QGraphicsProxyWidget): The QGraphicItem containing the widget in the scene.
     """
 
+    # Class constants
+    # ---------------
+    # Angle delta of a single mouse wheel step, in eighths of a degree
+    WHEEL_STEP_DELTA = 120
+
     # Initialization and Setup
     # ------------------------
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None,
@@ -50,18 +56,27 @@ class ScalableView(QtWidgets.QGraphicsView):
         # Set the current zoom level to 1.0 (no zoom)
         self.current_zoom_level = 1.0
 
+        # Transform reused to apply the zoom level to the view
+        self._zoom_transform = QtGui.QTransform()
+
+        # Wheel delta accumulated since the last zoom step
+        self._wheel_accum = 0
+        # Whether a zoom step is already scheduled for the accumulated wheel delta
+        self._is_zoom_pending = False
+
     def _setup_ui(self):
         """Set up the UI for the widget, including creating widgets and layouts.
         """
         # Set the scene
         self.setScene(QtWidgets.QGraphicsScene(self))
-        # Set the widget as the central widget of the scene
-        self.scene().addWidget(self.widget)
+        # Set the widget as the central widget of the scene, and keep the QGraphicItem containing the widget
+        self.graphic_item = self.scene().addWidget(self.widget)
         # Set the alignment of the widget to the top left corner
         self.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignLeft)
 
-        # Set the viewport update mode to full viewport update to ensure that the entire view is updated when scaling
-        self.setViewportUpdateMode(QtWidgets.QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        # Set the viewport update mode to smart viewport update, so only the dirty regions of the widget are repainted
+        # NOTE: Changing the transform when scaling always repaints the entire viewport, regardless of the update mode
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
         # Set the rendering hints to smooth pixels to improve the quality of the rendering
         self.setRenderHints(QtGui.QPainter.RenderHint.SmoothPixmapTransform)
 
@@ -73,9 +88,8 @@ class ScalableView(QtWidgets.QGraphicsView):
     def _setup_signal_connections(self):
         """Set up signal connections between widgets and slots.
         """
-        # Connect the wheel event signal to the scaling slot
-        self.viewport().installEventFilter(self)
-        self.viewport().wheelEvent = self.wheelEvent
+        # NOTE: Wheel events on the viewport are forwarded to the overridden `wheelEvent` by the view itself,
+        # so no event filter or handler reassignment on the viewport is needed
 
         # Key Binds
         # ---------
@@ -83,6 +97,51 @@ class ScalableView(QtWidgets.QGraphicsView):
         shortcut = QtWidgets.QShortcut(QtGui.QKeySequence(QtCore.Qt.Key.Key_F), self)
         shortcut.activated.connect(self.reset_scale)
 
+    # Private Methods
+    # ---------------
+    def _relayout_proxy(self) -> None:
+        """Resize the widget to the full size of the view, reserved for scaling.
+        """
+        # Get the size of the view
+        view_size = self.size()
+        # Get the inverse of the current zoom level once
+        inverse_zoom_level = 1.0 / self.current_zoom_level
+
+        # Create a QRectF object with the size of the view reserved for scaling
+        rect = QtCore.QRectF(
+            0, 0,
+            view_size.width() * inverse_zoom_level - 2,
+            view_size.height() * inverse_zoom_level - 2)
+
+        # Set the size of the widget to the size of the view
+        self.graphic_item.setGeometry(rect)
+        self.scene().setSceneRect(rect)
+
+    @QtCore.pyqtSlot()
+    def _apply_zoom(self) -> None:
+        """Scale the view by the whole wheel steps accumulated since the last zoom step.
+        """
+        self._is_zoom_pending = False
+
+        # Get the number of whole wheel steps accumulated, and keep the remainder for the next events
+        wheel_steps = int(self._wheel_accum / self.WHEEL_STEP_DELTA)
+
+        # Return if less than one wheel step has been accumulated
+        if not wheel_steps:
+            return
+
+        self._wheel_accum -= wheel_steps * self.WHEEL_STEP_DELTA
+
+        # Calculate the scaling factor based on the wheel steps, compounding 10% per step
+        scale_factor = (1.1 if wheel_steps > 0 else 0.9) ** abs(wheel_steps)
+        # Get the current scaling of the view
+        self.current_zoom_level = self.transform().m11()
+
+        # Calculate the new zoom level
+        new_zoom_level = self.current_zoom_level * scale_factor
+        # Set scale of the view to new zoom level.
+        self.set_scale(new_zoom_level)
+
     # Extended Methods
     # ----------------
     def set_scale(self, zoom_level: float = 1.0) -> None:
@@ -91,14 +150,17 @@ class ScalableView(QtWidgets.QGraphicsView):
         # Clamp the zoom level between the min and max zoom levels
         zoom_level = max(self.min_zoom_level, min(zoom_level, self.max_zoom_level))
 
-        # Set the new zoom level
-        self.setTransform(QtGui.QTransform().scale(zoom_level, zoom_level))
+        # Set the new zoom level, reusing the same transform object
+        self._zoom_transform.reset()
+        self._zoom_transform.scale(zoom_level, zoom_level)
+        self.setTransform(self._zoom_transform)
         # Update current zoom level
         self.current_zoom_level = zoom_level
 
         # Update the size of the widget to fit the view window
-        self.resizeEvent(None)
+        self._relayout_proxy()
 
+    @QtCore.pyqtSlot()
     def reset_scale(self) -> None:
         """Reset scaling of the view to default zoom level (1.0 or no zoom).
         """
@@ -108,44 +170,28 @@ class ScalableView(QtWidgets.QGraphicsView):
         self.current_zoom_level = 1.0
 
         # Update the size of the widget to fit the view window
-        self.resizeEvent(None)
+        self._relayout_proxy()
 
     # Event Handling or Override Methods
     # ----------------------------------
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         """Handle resize events to resize the widget to the full size of the view, reserved for scaling.
         """
-        # Get the size of the view
-        view_size = self.size()
-        # Get the QGraphicItem containing the widget
-        graphic_item = self.scene().itemAt(0, 0, QtGui.QTransform())
-
-        # Create a QRectF object with the size of the view reserved for scaling
-        rect = QtCore.QRectF(
-            0, 0,
-            view_size.width() / self.current_zoom_level-2,
-            view_size.height() / self.current_zoom_level-2)
-
-        # Set the size of the widget to the size of the view
-        graphic_item.setGeometry(rect)
-        self.scene().setSceneRect(rect)
+        # Resize the widget to fit the view window
+        self._relayout_proxy()
 
     def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
         """Handle wheel events to allow the user to scale the contents of the view.
         """
         # Check if the Ctrl key is pressed
         if event.modifiers() == QtCore.Qt.KeyboardModifier.ControlModifier:
-            # Get the scroll delta
-            scroll_delta = event.angleDelta().y()
-            # Calculate the scaling factor based on the wheel delta
-            scale_factor = 1 + (scroll_delta / 120) / 10
-            # Get the current scaling of the view
-            self.current_zoom_level = self.transform().m11()
-
-            # Calculate the new zoom level
-            new_zoom_level = self.current_zoom_level * scale_factor
-            # Set scale of the view to new zoom level.
-            self.set_scale(new_zoom_level)
+            # Accumulate the scroll delta, so small trackpad increments add up to full wheel steps
+            self._wheel_accum += event.angleDelta().y()
+
+            # Schedule a single zoom step for all wheel events delivered in this event loop iteration
+            if not self._is_zoom_pending:
+                self._is_zoom_pending = True
+                QtCore.QTimer.singleShot(0, self._apply_zoom)
 
         # If the Ctrl key is not pressed, pass the event on to the parent class
         else: